@@ -2,7 +2,7 @@
 
 import logging
 
-from flask import Flask
+from flask import Flask, g
 from flask_cors import CORS
 from prometheus_client import make_wsgi_app
 from werkzeug.middleware.dispatcher import DispatcherMiddleware
@@ -33,7 +33,25 @@ def create_app(config_class: type = Config) -> Flask:
 
     # Initialize database
     with app.app_context():
-        init_db(app)
+        init_db(app, config_class)
+
+    # Commit each request's writes as a single transaction
+    @app.after_request
+    def commit_db(response):
+        """Commit pending writes, or roll them back on server errors."""
+        db = g.get("db")
+        if db is not None:
+            if response.status_code >= 500:
+                db.rollback()
+            else:
+                db.commit()
+        return response
+
+    @app.teardown_request
+    def rollback_db(exc):
+        """Roll back pending writes if the request raised."""
+        if exc is not None and g.get("db") is not None:
+            g.db.rollback()
 
     # Register blueprints
     from .auth import auth_bp
@@ -2,11 +2,12 @@
 
 import hashlib
 import logging
+import uuid
 from datetime import datetime, timedelta
 
 import bcrypt
 import jwt
-from flask import Blueprint, current_app, jsonify, request
+from flask import Blueprint, current_app, has_app_context, jsonify, request
 
 try:
     from penguin_libs.logging import SanitizedLogger
@@ -28,8 +29,10 @@ auth_bp = Blueprint("auth", __name__)
 
 
 def hash_password(password: str) -> str:
-    """Hash password using bcrypt."""
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    """Hash password using bcrypt at the app's configured cost."""
+    rounds = current_app.config.get("BCRYPT_ROUNDS", 12) if has_app_context() else 12
+    salt = bcrypt.gensalt(rounds=rounds)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(password: str, password_hash: str) -> bool:
@@ -58,6 +61,7 @@ def create_refresh_token(user_id: int) -> tuple[str, datetime]:
         "type": "refresh",
         "exp": expires,
         "iat": datetime.utcnow(),
+        "jti": uuid.uuid4().hex,
     }
     token = jwt.encode(payload, current_app.config["JWT_SECRET_KEY"], algorithm="HS256")
 
@@ -2,6 +2,7 @@
 
 import os
 from datetime import timedelta
+from functools import lru_cache
 
 from .secrets import get_secret
 
@@ -22,6 +23,9 @@ class Config:
         days=int(os.getenv("JWT_REFRESH_TOKEN_DAYS", "7"))
     )
 
+    # Password hashing
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
     # Database - PyDAL compatible
     DB_TYPE = os.getenv("DB_TYPE", "postgres")
     DB_HOST = os.getenv("DB_HOST", "localhost")
@@ -30,6 +34,7 @@ class Config:
     DB_USER = os.getenv("DB_USER", "app_user")
     DB_PASS = get_secret("DB_PASS", "app_pass")
     DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MIGRATE = os.getenv("DB_MIGRATE", "true").lower() == "true"
 
     # OpenSearch - Logs and Analytics
     OPENSEARCH_HOST = os.getenv("OPENSEARCH_HOST", "localhost")
@@ -48,8 +53,12 @@ class Config:
     PRODUCT_NAME = os.getenv("PRODUCT_NAME", "cerberus")
 
     @classmethod
+    @lru_cache(maxsize=None)
     def get_db_uri(cls) -> str:
-        """Build PyDAL-compatible database URI."""
+        """Build PyDAL-compatible database URI.
+
+        Cached per class, since the settings it reads are fixed at import.
+        """
         db_type = cls.DB_TYPE
 
         # Map common aliases to PyDAL format
@@ -86,5 +95,20 @@ class TestingConfig(Config):
     """Testing configuration."""
 
     TESTING = True
+    BCRYPT_ROUNDS = 4
     DB_TYPE = "sqlite"
     DB_NAME = ":memory:"
+    # A fresh in-memory database has no schema until it is migrated
+    DB_MIGRATE = True
+    # No pooling: each app keeps its own connection, and with it its own
+    # in-memory database, rather than picking up another app's pooled one
+    DB_POOL_SIZE = 0
+
+    @classmethod
+    def get_db_uri(cls) -> str:
+        """Use an in-memory SQLite database.
+
+        The database is private to the process, so each pytest-xdist worker
+        gets its own.
+        """
+        return "sqlite:memory"
@@ -28,16 +28,26 @@ VPN_STATUS = ["active", "inactive", "connecting", "error"]
 AUDIT_ACTIONS = ["create", "update", "delete", "login", "logout", "config_change"]
 
 
-def init_db(app: Flask) -> DAL:
-    """Initialize database connection and define tables."""
-    db_uri = Config.get_db_uri()
+def init_db(app: Flask, config_class: type = Config) -> DAL:
+    """Initialize database connection and define tables.
+
+    When migrating, every table is defined up front so schema changes (and
+    the commits PyDAL issues after them) happen here rather than inside the
+    first request to touch a table. Without migrations, tables are defined
+    lazily on first access, so workers that never touch the NGFW tables
+    don't pay for them.
+    """
+    db_uri = config_class.get_db_uri()
 
     db = DAL(
         db_uri,
-        pool_size=Config.DB_POOL_SIZE,
-        migrate=True,
-        check_reserved=["all"],
-        lazy_tables=False,
+        pool_size=config_class.DB_POOL_SIZE,
+        migrate=config_class.DB_MIGRATE,
+        # PyDAL quotes identifiers, so only SQL-standard keywords need
+        # rejecting; per-engine lists flag columns such as "action" (SQLite)
+        # and "timestamp" (PostgreSQL) that are safe once quoted
+        check_reserved=["common"],
+        lazy_tables=not config_class.DB_MIGRATE,
     )
 
     # Define users table
@@ -333,7 +343,11 @@ def init_db(app: Flask) -> DAL:
 
 
 def get_db() -> DAL:
-    """Get database connection for current request context."""
+    """Get database connection for current request context.
+
+    The helpers below do not commit; writes made during a request are
+    committed together when the request finishes (see ``create_app``).
+    """
     from flask import current_app
 
     if "db" not in g:
@@ -357,21 +371,38 @@ def get_user_by_id(user_id: int) -> Optional[dict]:
 
 def create_user(email: str, password_hash: str, full_name: str = "",
                 role: str = "viewer") -> dict:
-    """Create a new user."""
+    """Create a new user.
+
+    The returned dict is built from the inserted values rather than re-read
+    from the database.
+    """
     db = get_db()
-    user_id = db.users.insert(
-        email=email,
-        password_hash=password_hash,
-        full_name=full_name,
-        role=role,
-        is_active=True,
-    )
-    db.commit()
-    return get_user_by_id(user_id)
+    now = datetime.utcnow()
+    user = {
+        "email": email,
+        "password_hash": password_hash,
+        "full_name": full_name,
+        "role": role,
+        "is_active": True,
+        "created_at": now,
+        "updated_at": now,
+    }
+    user_id = db.users.insert(**user)
+    return {"id": int(user_id), **user}
+
+
+def bulk_create_users(rows: list[dict]) -> list[int]:
+    """Create several users with a single bulk insert and return their IDs."""
+    db = get_db()
+    return [int(user_id) for user_id in db.users.bulk_insert(rows)]
 
 
-def update_user(user_id: int, **kwargs) -> Optional[dict]:
-    """Update user by ID."""
+def update_user(user_id: int, current: Optional[dict] = None, **kwargs) -> Optional[dict]:
+    """Update user by ID.
+
+    If ``current`` (the user as previously fetched) is given, the updated user
+    is merged from it instead of being re-read from the database.
+    """
     db = get_db()
 
     # Filter allowed fields
@@ -379,18 +410,20 @@ def update_user(user_id: int, **kwargs) -> Optional[dict]:
     update_data = {k: v for k, v in kwargs.items() if k in allowed_fields}
 
     if not update_data:
-        return get_user_by_id(user_id)
+        return current if current is not None else get_user_by_id(user_id)
 
-    db(db.users.id == user_id).update(**update_data)
-    db.commit()
-    return get_user_by_id(user_id)
+    update_data["updated_at"] = datetime.utcnow()
+    updated = db(db.users.id == user_id).update(**update_data)
+
+    if current is None:
+        return get_user_by_id(user_id)
+    return {**current, **update_data} if updated else None
 
 
 def delete_user(user_id: int) -> bool:
     """Delete user by ID."""
     db = get_db()
     deleted = db(db.users.id == user_id).delete()
-    db.commit()
     return deleted > 0
 
 
@@ -416,7 +449,6 @@ def store_refresh_token(user_id: int, token_hash: str, expires_at: datetime) ->
         token_hash=token_hash,
         expires_at=expires_at,
     )
-    db.commit()
     return token_id
 
 
@@ -424,7 +456,6 @@ def revoke_refresh_token(token_hash: str) -> bool:
     """Revoke a refresh token."""
     db = get_db()
     updated = db(db.refresh_tokens.token_hash == token_hash).update(revoked=True)
-    db.commit()
     return updated > 0
 
 
@@ -443,5 +474,4 @@ def revoke_all_user_tokens(user_id: int) -> int:
     """Revoke all refresh tokens for a user."""
     db = get_db()
     updated = db(db.refresh_tokens.user_id == user_id).update(revoked=True)
-    db.commit()
     return updated
@@ -174,7 +174,7 @@ def update_existing_user(user_id: int):
     if not update_data:
         return jsonify({"error": "No valid fields to update"}), 400
 
-    updated_user = update_user(user_id, **update_data)
+    updated_user = update_user(user_id, current=user, **update_data)
 
     logger.info("Admin updated user ID %d", user_id)
 
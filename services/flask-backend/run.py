@@ -60,6 +60,7 @@ def create_default_admin():
                 full_name="System Administrator",
                 role="admin",
             )
+            db.commit()
             logger.info("Default admin user created successfully")
             logger.warning("Change the default password immediately!")
         else:
@@ -1,86 +1,132 @@
 """Shared test fixtures for API tests."""
 
-import os
-import sys
-
 import pytest
 
-# Add Flask backend to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../services/flask-backend"))
-
 from app import create_app
-from app.auth import hash_password
 from app.config import TestingConfig
-from app.models import create_user, get_db, init_db
+from app.models import create_user, get_db
+
+# Pre-computed bcrypt hashes (cost 4) of the fixture users' passwords
+ADMIN_PASSWORD_HASH = "$2b$04$tfzQoKFqUtMgIruIPR722OUwWNqnG0u0NJIqqZYwQGxb.tN5cgbdG"
+VIEWER_PASSWORD_HASH = "$2b$04$Kb2eOkZT3GcWj7BFeUjwSOlJ3JV3xnwbAmxJnG5mtjkX4Z1yE5wDy"
 
 
 @pytest.fixture(scope="session")
 def app():
     """Create application for testing."""
     app = create_app(TestingConfig)
-    yield app
+    with app.app_context():
+        yield app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
-    """Create test client."""
-    with app.test_client() as client:
-        with app.app_context():
-            yield client
+    """Create test client shared by the tests in a module.
 
+    Auth is header-only, so cookies are disabled to keep tests from leaking
+    state into each other through the shared cookie jar.
+    """
+    with app.test_client(use_cookies=False) as client:
+        yield client
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
+def db_rollback(app, monkeypatch, admin_user, viewer_user):
+    """Roll back everything a test writes.
+
+    Commits (including the per-request commit) are no-ops for the duration
+    of the test, so fixture and API writes share one transaction. The seeded
+    users are requested here so they are committed before that happens, even
+    when a test only reaches them through ``request.getfixturevalue``.
+    """
+    db = get_db()
+    monkeypatch.setattr(db, "commit", lambda: None)
+    yield
+    db.rollback()
+
+
+@pytest.fixture(scope="session")
 def admin_user(app):
-    """Create admin user and return credentials."""
-    with app.app_context():
-        user = create_user(
-            email="admin@test.com",
-            password_hash=hash_password("adminpass123"),
-            full_name="Test Admin",
-            role="admin",
-        )
-        return {
-            "id": user["id"],
-            "email": "admin@test.com",
-            "password": "adminpass123",
-            "role": "admin",
-        }
+    """Create admin user once per session and return credentials."""
+    user = create_user(
+        email="admin@test.com",
+        password_hash=ADMIN_PASSWORD_HASH,
+        full_name="Test Admin",
+        role="admin",
+    )
+    get_db().commit()
+    return {
+        "id": user["id"],
+        "email": "admin@test.com",
+        "password": "adminpass123",
+        "role": "admin",
+    }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def viewer_user(app):
-    """Create viewer user and return credentials."""
-    with app.app_context():
-        user = create_user(
-            email="viewer@test.com",
-            password_hash=hash_password("viewerpass123"),
-            full_name="Test Viewer",
-            role="viewer",
-        )
-        return {
-            "id": user["id"],
-            "email": "viewer@test.com",
-            "password": "viewerpass123",
-            "role": "viewer",
-        }
+    """Create viewer user once per session and return credentials."""
+    user = create_user(
+        email="viewer@test.com",
+        password_hash=VIEWER_PASSWORD_HASH,
+        full_name="Test Viewer",
+        role="viewer",
+    )
+    get_db().commit()
+    return {
+        "id": user["id"],
+        "email": "viewer@test.com",
+        "password": "viewerpass123",
+        "role": "viewer",
+    }
 
 
 @pytest.fixture
-def admin_token(client, admin_user):
-    """Get admin access token."""
-    response = client.post(
-        "/api/v1/auth/login",
-        json={"email": admin_user["email"], "password": admin_user["password"]},
+def throwaway_user(app):
+    """Create a viewer user that only exists for the current test."""
+    return create_user(
+        email="throwaway@test.com",
+        password_hash=VIEWER_PASSWORD_HASH,
+        full_name="Throwaway User",
+        role="viewer",
     )
-    return response.get_json()["access_token"]
+
+
+@pytest.fixture(scope="session")
+def admin_token(app, admin_user):
+    """Get admin access token, shared by the whole session."""
+    return login(app.test_client(), admin_user)
+
+
+@pytest.fixture(scope="session")
+def viewer_token(app, viewer_user):
+    """Get viewer access token, shared by the whole session."""
+    return login(app.test_client(), viewer_user)
+
+
+@pytest.fixture(scope="session")
+def admin_headers(admin_token):
+    """Authorization header for the admin token."""
+    return auth_header(admin_token)
+
+
+@pytest.fixture(scope="session")
+def viewer_headers(viewer_token):
+    """Authorization header for the viewer token."""
+    return auth_header(viewer_token)
 
 
 @pytest.fixture
-def viewer_token(client, viewer_user):
-    """Get viewer access token."""
+def fresh_admin_token(client, admin_user):
+    """Get a new admin access token for tests that invalidate it."""
+    return login(client, admin_user)
+
+
+def login(client, user: dict) -> str:
+    """Log in as a fixture user and return the access token."""
     response = client.post(
         "/api/v1/auth/login",
-        json={"email": viewer_user["email"], "password": viewer_user["password"]},
+        json={"email": user["email"], "password": user["password"]},
     )
     return response.get_json()["access_token"]
 
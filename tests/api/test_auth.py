@@ -82,8 +82,8 @@ class TestRegister:
 class TestMe:
     """Tests for GET /api/v1/auth/me."""
 
-    def test_me_authenticated(self, client, admin_token):
-        response = client.get("/api/v1/auth/me", headers=auth_header(admin_token))
+    def test_me_authenticated(self, client, admin_headers):
+        response = client.get("/api/v1/auth/me", headers=admin_headers)
         assert response.status_code == 200
         data = response.get_json()
         assert "email" in data
@@ -122,9 +122,9 @@ class TestRefresh:
 class TestLogout:
     """Tests for POST /api/v1/auth/logout."""
 
-    def test_logout_success(self, client, admin_token):
+    def test_logout_success(self, client, fresh_admin_token):
         response = client.post(
-            "/api/v1/auth/logout", headers=auth_header(admin_token)
+            "/api/v1/auth/logout", headers=auth_header(fresh_admin_token)
         )
         assert response.status_code == 200
 
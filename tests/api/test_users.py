@@ -1,30 +1,31 @@
 """API tests for user management endpoints."""
 
-from conftest import auth_header
+import pytest
+
+# (headers fixture, expected status) for callers that may not manage users
+DENIED = [("viewer_headers", 403), (None, 401)]
 
 
 class TestListUsers:
     """Tests for GET /api/v1/users."""
 
-    def test_list_users_as_admin(self, client, admin_token):
-        response = client.get("/api/v1/users", headers=auth_header(admin_token))
+    def test_list_users_as_admin(self, client, admin_headers):
+        response = client.get("/api/v1/users", headers=admin_headers)
         assert response.status_code == 200
         data = response.get_json()
         assert "users" in data
         assert "pagination" in data
 
-    def test_list_users_as_viewer(self, client, viewer_token):
-        response = client.get("/api/v1/users", headers=auth_header(viewer_token))
-        assert response.status_code == 403
-
-    def test_list_users_no_auth(self, client):
-        response = client.get("/api/v1/users")
-        assert response.status_code == 401
+    @pytest.mark.parametrize("auth, status", DENIED)
+    def test_list_users_denied(self, client, request, auth, status):
+        headers = request.getfixturevalue(auth) if auth else {}
+        response = client.get("/api/v1/users", headers=headers)
+        assert response.status_code == status
 
-    def test_list_users_pagination(self, client, admin_token):
+    def test_list_users_pagination(self, client, admin_headers):
         response = client.get(
             "/api/v1/users?page=1&per_page=5",
-            headers=auth_header(admin_token),
+            headers=admin_headers,
         )
         assert response.status_code == 200
         data = response.get_json()
@@ -34,10 +35,10 @@ class TestListUsers:
 class TestCreateUser:
     """Tests for POST /api/v1/users."""
 
-    def test_create_user_as_admin(self, client, admin_token):
+    def test_create_user_as_admin(self, client, admin_headers):
         response = client.post(
             "/api/v1/users",
-            headers=auth_header(admin_token),
+            headers=admin_headers,
             json={
                 "email": "created@test.com",
                 "password": "password123",
@@ -50,10 +51,12 @@ class TestCreateUser:
         assert data["user"]["role"] == "maintainer"
         assert "password_hash" not in data["user"]
 
-    def test_create_user_as_viewer(self, client, viewer_token):
+    @pytest.mark.parametrize("auth, status", DENIED)
+    def test_create_user_denied(self, client, request, auth, status):
+        headers = request.getfixturevalue(auth) if auth else {}
         response = client.post(
             "/api/v1/users",
-            headers=auth_header(viewer_token),
+            headers=headers,
             json={
                 "email": "blocked@test.com",
                 "password": "password123",
@@ -61,12 +64,12 @@ class TestCreateUser:
                 "role": "viewer",
             },
         )
-        assert response.status_code == 403
+        assert response.status_code == status
 
-    def test_create_user_invalid_role(self, client, admin_token):
+    def test_create_user_invalid_role(self, client, admin_headers):
         response = client.post(
             "/api/v1/users",
-            headers=auth_header(admin_token),
+            headers=admin_headers,
             json={
                 "email": "bad@test.com",
                 "password": "password123",
@@ -80,19 +83,19 @@ class TestCreateUser:
 class TestGetUser:
     """Tests for GET /api/v1/users/<id>."""
 
-    def test_get_user_as_admin(self, client, admin_token, admin_user):
+    def test_get_user_as_admin(self, client, admin_headers, admin_user):
         response = client.get(
             f"/api/v1/users/{admin_user['id']}",
-            headers=auth_header(admin_token),
+            headers=admin_headers,
         )
         assert response.status_code == 200
         data = response.get_json()
         assert data["email"] == admin_user["email"]
         assert "password_hash" not in data
 
-    def test_get_nonexistent_user(self, client, admin_token):
+    def test_get_nonexistent_user(self, client, admin_headers):
         response = client.get(
-            "/api/v1/users/99999", headers=auth_header(admin_token)
+            "/api/v1/users/99999", headers=admin_headers
         )
         assert response.status_code == 404
 
@@ -100,10 +103,10 @@ class TestGetUser:
 class TestUpdateUser:
     """Tests for PUT /api/v1/users/<id>."""
 
-    def test_update_user_name(self, client, admin_token, admin_user):
+    def test_update_user_name(self, client, admin_headers, throwaway_user):
         response = client.put(
-            f"/api/v1/users/{admin_user['id']}",
-            headers=auth_header(admin_token),
+            f"/api/v1/users/{throwaway_user['id']}",
+            headers=admin_headers,
             json={"full_name": "Updated Name"},
         )
         assert response.status_code == 200
@@ -114,10 +117,10 @@ class TestUpdateUser:
 class TestDeleteUser:
     """Tests for DELETE /api/v1/users/<id>."""
 
-    def test_cannot_delete_self(self, client, admin_token, admin_user):
+    def test_cannot_delete_self(self, client, admin_headers, admin_user):
         response = client.delete(
             f"/api/v1/users/{admin_user['id']}",
-            headers=auth_header(admin_token),
+            headers=admin_headers,
         )
         assert response.status_code == 400
 
@@ -125,9 +128,9 @@ class TestDeleteUser:
 class TestRoles:
     """Tests for GET /api/v1/users/roles."""
 
-    def test_get_roles(self, client, admin_token):
+    def test_get_roles(self, client, admin_headers):
         response = client.get(
-            "/api/v1/users/roles", headers=auth_header(admin_token)
+            "/api/v1/users/roles", headers=admin_headers
         )
         assert response.status_code == 200
         data = response.get_json()
@@ -0,0 +1,11 @@
+"""Shared test setup for all Python test suites."""
+
+import os
+import sys
+
+# Add Flask backend to path once, before any test module is imported
+FLASK_BACKEND = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../services/flask-backend")
+)
+if FLASK_BACKEND not in sys.path:
+    sys.path.insert(0, FLASK_BACKEND)
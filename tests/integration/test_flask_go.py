@@ -1,52 +1,68 @@
 """Integration tests for Flask <-> Go backend communication."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
+import httpx
 import pytest
-import requests
 
 FLASK_URL = os.getenv("FLASK_URL", "http://localhost:5000")
 GO_URL = os.getenv("GO_URL", "http://localhost:8080")
 
-pytestmark = pytest.mark.skipif(
-    os.getenv("RUN_INTEGRATION_TESTS", "false").lower() != "true",
-    reason="Set RUN_INTEGRATION_TESTS=true to run integration tests",
-)
 
+@pytest.fixture(scope="session")
+def flask_http():
+    """Keep-alive client for the Flask backend, shared by the session."""
+    with httpx.Client(base_url=FLASK_URL, timeout=5) as client:
+        yield client
 
+
+@pytest.fixture(scope="session")
+def go_http():
+    """Keep-alive client for the Go backend, shared by the session."""
+    with httpx.Client(base_url=GO_URL, timeout=5) as client:
+        yield client
+
+
+@pytest.mark.serial
 class TestFlaskGoIntegration:
     """Tests that Flask and Go backends can communicate."""
 
-    def test_flask_health(self):
-        response = requests.get(f"{FLASK_URL}/healthz", timeout=5)
+    def test_flask_health(self, flask_http):
+        response = flask_http.get("/healthz")
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
 
-    def test_go_health(self):
-        response = requests.get(f"{GO_URL}/healthz", timeout=5)
+    def test_go_health(self, go_http):
+        response = go_http.get("/healthz")
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
 
-    def test_go_status(self):
-        response = requests.get(f"{GO_URL}/api/v1/status", timeout=5)
+    def test_go_status(self, go_http):
+        response = go_http.get("/api/v1/status")
         assert response.status_code == 200
         data = response.json()
         assert "version" in data or "status" in data
 
-    def test_flask_login_and_go_status(self):
+    def test_flask_login_and_go_status(self, flask_http, go_http):
         """Verify auth token from Flask can be used across services."""
-        login_response = requests.post(
-            f"{FLASK_URL}/api/v1/auth/login",
-            json={
-                "email": os.getenv("ADMIN_EMAIL", "admin@example.com"),
-                "password": os.getenv("ADMIN_PASSWORD", "changeme123"),
-            },
-            timeout=5,
-        )
+        # The Go status call doesn't need the token, so issue both at once
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            login_future = pool.submit(
+                flask_http.post,
+                "/api/v1/auth/login",
+                json={
+                    "email": os.getenv("ADMIN_EMAIL", "admin@example.com"),
+                    "password": os.getenv("ADMIN_PASSWORD", "changeme123"),
+                },
+            )
+            go_future = pool.submit(go_http.get, "/api/v1/status")
+        login_response = login_future.result()
+        go_response = go_future.result()
+
         assert login_response.status_code == 200
         token = login_response.json()["access_token"]
         assert len(token) > 0
 
         # Go backend status should be accessible (no auth required)
-        go_response = requests.get(f"{GO_URL}/api/v1/status", timeout=5)
         assert go_response.status_code == 200
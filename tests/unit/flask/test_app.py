@@ -0,0 +1,86 @@
+"""Unit tests for the per-request transaction handling in create_app."""
+
+import pytest
+
+from app import create_app
+from app.config import TestingConfig
+from app.models import create_user, get_db, get_user_by_email
+
+PASSWORD_HASH = "$2b$04$tfzQoKFqUtMgIruIPR722OUwWNqnG0u0NJIqqZYwQGxb.tN5cgbdG"
+
+
+@pytest.fixture(scope="module")
+def app():
+    """App with extra routes that write a user and then end in various ways."""
+    app = create_app(TestingConfig)
+
+    def write(email):
+        create_user(email=email, password_hash=PASSWORD_HASH, full_name="Txn")
+
+    @app.route("/_test/ok/<email>", methods=["POST"])
+    def write_ok(email):
+        write(email)
+        return {}, 201
+
+    @app.route("/_test/error/<email>", methods=["POST"])
+    def write_error(email):
+        write(email)
+        return {}, 500
+
+    @app.route("/_test/schema/<email>", methods=["POST"])
+    def write_touch_table_error(email):
+        write(email)
+        get_db().zones  # first use of a table other than users
+        return {}, 500
+
+    @app.route("/_test/raise/<email>", methods=["POST"])
+    def write_raise(email):
+        write(email)
+        raise RuntimeError("boom")
+
+    return app
+
+
+@pytest.fixture
+def ctx(app):
+    """Run a test in an app context and drop any users it committed."""
+    with app.app_context():
+        yield
+        db = get_db()
+        db(db.users.full_name == "Txn").delete()
+        db.commit()
+
+
+def committed(email: str) -> bool:
+    """Whether a user survives rolling back the current transaction."""
+    get_db().rollback()
+    return get_user_by_email(email) is not None
+
+
+def pending(email: str) -> bool:
+    """Whether a user is visible on the connection, committed or not."""
+    return get_user_by_email(email) is not None
+
+
+class TestRequestTransactions:
+    """Writes are committed after a request unless it failed."""
+
+    def test_success_commits(self, app, ctx):
+        response = app.test_client().post("/_test/ok/ok@example.com")
+        assert response.status_code == 201
+        assert committed("ok@example.com")
+
+    def test_server_error_rolls_back(self, app, ctx):
+        response = app.test_client().post("/_test/error/error@example.com")
+        assert response.status_code == 500
+        assert not pending("error@example.com")
+
+    def test_server_error_rolls_back_after_touching_table(self, app, ctx):
+        response = app.test_client().post("/_test/schema/schema@example.com")
+        assert response.status_code == 500
+        assert not pending("schema@example.com")
+
+    def test_exception_rolls_back(self, app, ctx):
+        with pytest.raises(RuntimeError):
+            app.test_client().post("/_test/raise/raise@example.com")
+        assert not pending("raise@example.com")
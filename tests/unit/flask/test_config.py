@@ -1,9 +1,6 @@
 """Unit tests for Flask configuration loading."""
 
 import os
-import sys
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../../services/flask-backend"))
 
 from app.config import Config, DevelopmentConfig, ProductionConfig, TestingConfig
 
@@ -18,6 +15,9 @@ class TestConfig:
         uri = Config.get_db_uri()
         assert uri.startswith("postgres://")
 
+    def test_get_db_uri_cached(self):
+        assert Config.get_db_uri() is Config.get_db_uri()
+
     def test_jwt_defaults(self):
         assert Config.JWT_ACCESS_TOKEN_EXPIRES.total_seconds() > 0
         assert Config.JWT_REFRESH_TOKEN_EXPIRES.total_seconds() > 0
@@ -45,3 +45,11 @@ class TestTestingConfig:
 
     def test_sqlite_db(self):
         assert TestingConfig.DB_TYPE == "sqlite"
+
+    def test_in_memory_db(self):
+        assert TestingConfig.get_db_uri() == "sqlite:memory"
+        assert TestingConfig.DB_POOL_SIZE == 0
+        assert TestingConfig.DB_MIGRATE is True
+
+    def test_cheap_bcrypt_rounds(self):
+        assert TestingConfig.BCRYPT_ROUNDS < Config.BCRYPT_ROUNDS
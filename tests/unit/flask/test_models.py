@@ -1,18 +1,15 @@
 """Unit tests for PyDAL model operations."""
 
-import os
-import sys
-
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../../services/flask-backend"))
-
 from app import create_app
 from app.auth import hash_password, verify_password
 from app.config import TestingConfig
 from app.models import (
+    bulk_create_users,
     create_user,
     delete_user,
+    get_db,
     get_user_by_email,
     get_user_by_id,
     list_users,
@@ -20,45 +17,78 @@ from app.models import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
     app = create_app(TestingConfig)
     yield app
 
 
+class LazyTestingConfig(TestingConfig):
+    """TestingConfig without migrations, so tables are defined lazily."""
+
+    DB_MIGRATE = False
+
+
+@pytest.fixture(scope="session")
+def canned_hash(app):
+    """bcrypt hash of "password123", computed once per session."""
+    with app.app_context():
+        return hash_password("password123")
+
+
 @pytest.fixture
 def ctx(app):
+    """Run a test in an app context and roll back anything it wrote."""
     with app.app_context():
         yield
+        get_db().rollback()
 
 
 class TestPasswordHashing:
     """Tests for password hashing utilities."""
 
-    def test_hash_and_verify(self):
+    def test_hash_and_verify(self, ctx):
         password = "secure_password_123"
         hashed = hash_password(password)
         assert hashed != password
         assert verify_password(password, hashed)
 
-    def test_wrong_password(self):
+    def test_wrong_password(self, ctx):
         hashed = hash_password("correct_password")
         assert not verify_password("wrong_password", hashed)
 
-    def test_different_hashes(self):
+    def test_different_hashes(self, ctx):
         password = "same_password"
         hash1 = hash_password(password)
         hash2 = hash_password(password)
         assert hash1 != hash2  # bcrypt uses random salt
 
+    def test_uses_configured_rounds(self, ctx):
+        assert hash_password("password").startswith("$2b$04$")
+
+
+class TestSchema:
+    """Tests for the table definitions in init_db."""
+
+    def test_all_tables_defined_eagerly(self, app):
+        assert not app.config["db"]._LAZY_TABLES
+
+    def test_lazy_tables_define(self):
+        db = create_app(LazyTestingConfig).config["db"]
+        lazy = list(db._LAZY_TABLES)
+        assert "firewall_rules" in lazy
+        for name in lazy:
+            db[name]
+        assert not db._LAZY_TABLES
+
 
 class TestUserCRUD:
     """Tests for user model CRUD operations."""
 
-    def test_create_user(self, ctx):
+    def test_create_user(self, ctx, canned_hash):
         user = create_user(
             email="test@example.com",
-            password_hash=hash_password("password123"),
+            password_hash=canned_hash,
             full_name="Test User",
             role="viewer",
         )
@@ -66,10 +96,10 @@ class TestUserCRUD:
         assert user["role"] == "viewer"
         assert "id" in user
 
-    def test_get_user_by_email(self, ctx):
+    def test_get_user_by_email(self, ctx, canned_hash):
         create_user(
             email="find@example.com",
-            password_hash=hash_password("password123"),
+            password_hash=canned_hash,
             full_name="Find Me",
             role="viewer",
         )
@@ -81,10 +111,10 @@ class TestUserCRUD:
         found = get_user_by_email("nonexistent@example.com")
         assert found is None
 
-    def test_get_user_by_id(self, ctx):
+    def test_get_user_by_id(self, ctx, canned_hash):
         user = create_user(
             email="byid@example.com",
-            password_hash=hash_password("password123"),
+            password_hash=canned_hash,
             full_name="By ID",
             role="admin",
         )
@@ -92,10 +122,10 @@ class TestUserCRUD:
         assert found is not None
         assert found["id"] == user["id"]
 
-    def test_update_user(self, ctx):
+    def test_update_user(self, ctx, canned_hash):
         user = create_user(
             email="update@example.com",
-            password_hash=hash_password("password123"),
+            password_hash=canned_hash,
             full_name="Before Update",
             role="viewer",
         )
@@ -103,10 +133,22 @@ class TestUserCRUD:
         assert updated["full_name"] == "After Update"
         assert updated["role"] == "maintainer"
 
-    def test_delete_user(self, ctx):
+    def test_update_user_with_current(self, ctx, canned_hash):
+        user = create_user(
+            email="current@example.com",
+            password_hash=canned_hash,
+            full_name="Before Update",
+            role="viewer",
+        )
+        updated = update_user(user["id"], current=user, full_name="After Update")
+        assert updated["full_name"] == "After Update"
+        assert updated["email"] == "current@example.com"
+        assert get_user_by_id(user["id"])["full_name"] == "After Update"
+
+    def test_delete_user(self, ctx, canned_hash):
         user = create_user(
             email="delete@example.com",
-            password_hash=hash_password("password123"),
+            password_hash=canned_hash,
             full_name="Delete Me",
             role="viewer",
         )
@@ -114,14 +156,30 @@ class TestUserCRUD:
         assert result is True
         assert get_user_by_id(user["id"]) is None
 
-    def test_list_users(self, ctx):
-        for i in range(3):
-            create_user(
-                email=f"list{i}@example.com",
-                password_hash=hash_password("password123"),
-                full_name=f"List User {i}",
-                role="viewer",
-            )
+    def test_list_users(self, ctx, canned_hash):
+        bulk_create_users([
+            {
+                "email": f"list{i}@example.com",
+                "password_hash": canned_hash,
+                "full_name": f"List User {i}",
+                "role": "viewer",
+            }
+            for i in range(3)
+        ])
         users, total = list_users(page=1, per_page=10)
         assert total >= 3
         assert len(users) >= 3
+
+    def test_writes_use_current_app_db(self, app, canned_hash):
+        other = create_app(TestingConfig)
+        with app.app_context():
+            user = create_user(
+                email="scoped@example.com",
+                password_hash=canned_hash,
+                full_name="Scoped",
+                role="viewer",
+            )
+            assert get_user_by_id(user["id"])["email"] == "scoped@example.com"
+            get_db().rollback()
+        with other.app_context():
+            assert get_user_by_email("scoped@example.com") is None